@@ -3,14 +3,19 @@ import helmet from 'helmet';
 import cors from 'cors';
 import rateLimit from 'express-rate-limit';
 import { healthRouter } from './routes/health.js';
-import { webhookRouter } from './routes/webhook.js';
+import { createWebhookRouter } from './routes/webhook.js';
+import { getConfig } from './config.js';
 import { logger } from './logger.js';
 
-export function createApp() {
+export function createApp(config = getConfig()) {
   const app = express();
 
   app.use(helmet());
-  app.use(cors());
+  // Only GitHub and the container healthcheck call us, neither from a
+  // browser, so CORS is just per-request overhead outside development.
+  if (!config.isProduction) {
+    app.use(cors());
+  }
   app.use(
     rateLimit({
       windowMs: 60 * 1000,
@@ -22,7 +27,7 @@ export function createApp() {
 
   // Webhook needs the raw body for signature verification, so mount it before
   // the JSON parser and have the route handler parse the buffer itself.
-  app.use('/webhook', express.raw({ type: 'application/json' }), webhookRouter);
+  app.use('/webhook', express.raw({ type: 'application/json' }), createWebhookRouter(config));
 
   app.use(express.json());
   app.use('/health', healthRouter);
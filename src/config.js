@@ -0,0 +1,15 @@
+let config;
+
+// Reads the environment once and caches the result. process.env lookups go
+// through a native getter, so keep them off the per-request path.
+export function getConfig() {
+  if (!config) {
+    config = Object.freeze({
+      isProduction: process.env.NODE_ENV === 'production',
+      port: Number(process.env.PORT) || 3000,
+      logLevel: process.env.LOG_LEVEL || 'info',
+      webhookSecret: process.env.GITHUB_WEBHOOK_SECRET || '',
+    });
+  }
+  return config;
+}
@@ -1,7 +1,13 @@
 import { createHmac, timingSafeEqual } from 'node:crypto';
 
+// 'sha256=' followed by a hex-encoded 32-byte digest.
+const SIGNATURE_LENGTH = 'sha256='.length + 64;
+
 export function verifySignature(secret, rawBody, signatureHeader) {
   if (!signatureHeader || typeof signatureHeader !== 'string') return false;
+  // The expected length is public, so rejecting on it early leaks nothing and
+  // spares hashing the body for malformed headers.
+  if (signatureHeader.length !== SIGNATURE_LENGTH) return false;
   if (!signatureHeader.startsWith('sha256=')) return false;
 
   const expected = 'sha256=' + createHmac('sha256', secret).update(rawBody).digest('hex');
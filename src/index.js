@@ -1,8 +1,9 @@
 import 'dotenv/config';
 import { createApp } from './app.js';
+import { getConfig } from './config.js';
 import { logger } from './logger.js';
 
-const port = Number(process.env.PORT) || 3000;
+const { port } = getConfig();
 
 const app = createApp();
 
@@ -1,9 +1,8 @@
 import winston from 'winston';
-
-const level = process.env.LOG_LEVEL || 'info';
+import { getConfig } from './config.js';
 
 export const logger = winston.createLogger({
-  level,
+  level: getConfig().logLevel,
   format: winston.format.combine(
     winston.format.timestamp(),
     winston.format.errors({ stack: true }),
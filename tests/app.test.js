@@ -0,0 +1,18 @@
+import request from 'supertest';
+import { createApp } from '../src/app.js';
+import { getConfig } from '../src/config.js';
+
+describe('createApp', () => {
+  test('sends CORS headers outside production', async () => {
+    const app = createApp({ ...getConfig(), isProduction: false });
+    const res = await request(app).get('/health').set('origin', 'https://example.com');
+    expect(res.headers['access-control-allow-origin']).toBe('*');
+  });
+
+  test('omits CORS headers in production', async () => {
+    const app = createApp({ ...getConfig(), isProduction: true });
+    const res = await request(app).get('/health').set('origin', 'https://example.com');
+    expect(res.status).toBe(200);
+    expect(res.headers['access-control-allow-origin']).toBeUndefined();
+  });
+});
@@ -0,0 +1,23 @@
+import { getConfig } from '../src/config.js';
+
+describe('getConfig', () => {
+  test('reads the environment once and returns the cached object', () => {
+    const original = process.env.LOG_LEVEL;
+    process.env.LOG_LEVEL = 'warn';
+    try {
+      const first = getConfig();
+      expect(first.logLevel).toBe('warn');
+
+      process.env.LOG_LEVEL = 'silly';
+      expect(getConfig()).toBe(first);
+      expect(getConfig().logLevel).toBe('warn');
+      expect(Object.isFrozen(first)).toBe(true);
+    } finally {
+      if (original === undefined) {
+        delete process.env.LOG_LEVEL;
+      } else {
+        process.env.LOG_LEVEL = original;
+      }
+    }
+  });
+});
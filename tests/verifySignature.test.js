@@ -1,4 +1,4 @@
-import { createHmac } from 'node:crypto';
+import { createHmac, createSecretKey } from 'node:crypto';
 import { verifySignature } from '../src/github/verifySignature.js';
 
 const secret = 'test-secret';
@@ -13,6 +13,12 @@ describe('verifySignature', () => {
     expect(verifySignature(secret, body, sign(body))).toBe(true);
   });
 
+  test('accepts a pre-imported secret key', () => {
+    const key = createSecretKey(Buffer.from(secret));
+    expect(verifySignature(key, body, sign(body))).toBe(true);
+    expect(verifySignature(key, body, 'sha256=' + '0'.repeat(64))).toBe(false);
+  });
+
   test('rejects a bad signature', () => {
     expect(verifySignature(secret, body, 'sha256=deadbeef')).toBe(false);
   });
@@ -21,4 +27,16 @@ describe('verifySignature', () => {
     expect(verifySignature(secret, body, undefined)).toBe(false);
     expect(verifySignature(secret, body, 'md5=abc')).toBe(false);
   });
+
+  test('rejects a signature of the wrong length', () => {
+    expect(verifySignature(secret, body, sign(body) + '0')).toBe(false);
+    expect(verifySignature(secret, body, sign(body).slice(0, -1))).toBe(false);
+    expect(verifySignature(secret, body, sign(body).slice(0, -1) + 'é')).toBe(false);
+  });
+
+  test('rejects a wrong-length header before hashing the body', () => {
+    // createHmac throws on an undefined key, so this only returns false if
+    // the length check short-circuits before any HMAC is computed.
+    expect(verifySignature(undefined, body, 'sha256=ab')).toBe(false);
+  });
 });
@@ -0,0 +1,43 @@
+import { createHmac } from 'node:crypto';
+import request from 'supertest';
+import { createApp } from '../src/app.js';
+import { getConfig } from '../src/config.js';
+
+const secret = 'test-secret';
+const body = JSON.stringify({ zen: 'Keep it logically awesome.' });
+
+function sign(b) {
+  return 'sha256=' + createHmac('sha256', secret).update(b).digest('hex');
+}
+
+function post(app, payload, signature) {
+  return request(app)
+    .post('/webhook')
+    .set('content-type', 'application/json')
+    .set('x-github-event', 'ping')
+    .set('x-github-delivery', 'test-delivery')
+    .set('x-hub-signature-256', signature)
+    .send(payload);
+}
+
+describe('POST /webhook', () => {
+  const app = createApp({ ...getConfig(), webhookSecret: secret });
+
+  test('accepts a correctly signed delivery', async () => {
+    const res = await post(app, body, sign(body));
+    expect(res.status).toBe(202);
+    expect(res.body.accepted).toBe(true);
+  });
+
+  test('rejects an invalid signature before parsing', async () => {
+    const res = await post(app, '{not json', 'sha256=deadbeef');
+    expect(res.status).toBe(401);
+    expect(res.body.error).toBe('invalid_signature');
+  });
+
+  test('rejects a signed body that is not JSON', async () => {
+    const res = await post(app, '{not json', sign('{not json'));
+    expect(res.status).toBe(400);
+    expect(res.body.error).toBe('invalid_json');
+  });
+});